@@ -21,12 +21,22 @@ app.secret_key = os.environ.get("SESSION_SECRET", "sarya_dev_secret_key")
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)  # needed for url_for to generate with https
 
 # Configure the database
-app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
+database_url = os.environ.get("DATABASE_URL")
+app.config["SQLALCHEMY_DATABASE_URI"] = database_url
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "pool_size": int(os.environ.get("DB_POOL_SIZE", 20)),
+    "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+    "pool_use_lifo": True,  # reuse the most recently returned connection so a small set stays warm
     "pool_recycle": 300,
     "pool_pre_ping": True,
 }
+if database_url and database_url.startswith("postgres"):
+    # Let the OS detect dead connections instead of waiting for a failed query
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"]["connect_args"] = {
+        "keepalives": 1,
+        "keepalives_idle": 30,
+    }
 
 # Initialize the app with the extension
 db.init_app(app)
@@ -31,6 +31,12 @@ try:
 except Exception as e:
     print(f"Error updating config: {e}")
 
+def get_page_args(default_limit=100, max_limit=500):
+    """Read limit/offset pagination arguments from the query string"""
+    limit = request.args.get('limit', default_limit, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    return max(1, min(limit, max_limit)), max(0, offset)
+
 @app.route('/')
 def index():
     """Home page"""
@@ -131,9 +137,10 @@ def get_config():
 # Database routes
 @app.route('/clones')
 def get_clones():
-    """Get all clones from the database"""
+    """Get a page of clones from the database"""
     try:
-        clones = Clone.query.all()
+        limit, offset = get_page_args()
+        clones = Clone.query.order_by(Clone.created_at.desc(), Clone.id).offset(offset).limit(limit).all()
         return jsonify([clone.to_dict() for clone in clones])
     except Exception as e:
         return jsonify({"error": str(e)})
@@ -355,9 +362,10 @@ def get_decisions():
 
 @app.route('/plugins')
 def get_plugins():
-    """Get all plugins from the database"""
+    """Get a page of plugins from the database"""
     try:
-        plugins = Plugin.query.all()
+        limit, offset = get_page_args()
+        plugins = Plugin.query.order_by(Plugin.created_at.desc(), Plugin.id).offset(offset).limit(limit).all()
         return jsonify([plugin.to_dict() for plugin in plugins])
     except Exception as e:
         return jsonify({"error": str(e)})
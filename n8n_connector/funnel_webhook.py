@@ -1,24 +1,88 @@
-
+import asyncio
+import logging
 import os
+import time
 import aiohttp
 import json
-from typing import Dict, Any
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# (epoch second, ISO string) of the last formatted timestamp
+_timestamp_cache = (0, "")
+
+def now_iso() -> str:
+    """Return the local time as an ISO-8601 string, formatted at most once per second."""
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, cached = _timestamp_cache
+    if second != cached_second:
+        cached = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache = (second, cached)
+    return cached
 
 class N8NWebhook:
-    def __init__(self):
+    def __init__(self, pool_size: int = 20):
         self.webhook_url = os.getenv("N8N_WEBHOOK_URL")
-        
+        self.pool_size = pool_size
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so it binds to the running event loop; reused so
+        # keep-alive connections to n8n survive between events. A session
+        # can't be used from another loop (e.g. a later asyncio.run), so a
+        # new loop gets a new session.
+        loop = asyncio.get_running_loop()
+        if (self.session is None or self.session.closed
+                or self._session_loop is not loop):
+            if self.session is not None and not self.session.closed:
+                self._release_session(self.session, self._session_loop)
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size)
+            )
+            self._session_loop = loop
+        return self.session
+
+    @staticmethod
+    def _release_session(session: aiohttp.ClientSession,
+                         loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        # Close a session left behind on another loop. If that loop is still
+        # running (e.g. in another thread) it can close the session itself;
+        # otherwise nothing can await close(), so detach the connector
+        # rather than let the session leak it
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            session.detach()
+            logger.warning("Detached N8N webhook session from a stopped event loop")
+
     async def trigger_event(self, event_type: str, data: Dict[str, Any]):
         payload = {
             "event": event_type,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "data": data
         }
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(self.webhook_url, json=payload) as response:
-                    return await response.json()
-            except Exception as e:
-                print(f"N8N webhook failed: {str(e)}")
-                return None
+
+        try:
+            async with self._get_session().post(self.webhook_url, json=payload) as response:
+                return await response.json()
+        except Exception as e:
+            print(f"N8N webhook failed: {str(e)}")
+            return None
+
+    async def close(self):
+        # Call from the loop that made the session, or use
+        # "async with N8NWebhook() as webhook:" to close it automatically
+        if (self.session is not None and not self.session.closed
+                and self._session_loop is asyncio.get_running_loop()):
+            await self.session.close()
+        self.session = None
+        self._session_loop = None
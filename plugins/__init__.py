@@ -2,3 +2,9 @@
 Plugins package for SARYA.
 Contains plugin interface and implementations.
 """
+
+import logging
+
+# Plugin loggers live under "plugin.<id>"; the application configures
+# handlers (see sarya.py), so plugins never attach their own
+logging.getLogger("plugin").addHandler(logging.NullHandler())
@@ -2,21 +2,13 @@
 Example Plugin for SARYA.
 Demonstrates a basic plugin implementation.
 """
-import logging
 import threading
-import time
 from typing import Any, Dict, List, Optional
 
 from core.event_bus import Event, event_bus
 
 from .plugin_interface import PluginInterface
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
 class ExamplePlugin(PluginInterface):
     """
     Example plugin for SARYA that demonstrates basic functionality.
@@ -40,8 +32,9 @@ class ExamplePlugin(PluginInterface):
         # Plugin-specific attributes
         self.counter = 0
         self.background_thread = None
-        self.running_thread = False
+        self.stop_event = threading.Event()
         self.interval = 60  # seconds
+        self.max_error_backoff = 600  # seconds
     
     def initialize(self) -> bool:
         """Initialize the plugin."""
@@ -92,7 +85,7 @@ class ExamplePlugin(PluginInterface):
                 return False
             
             # Start background thread
-            self.running_thread = True
+            self.stop_event.clear()
             self.background_thread = threading.Thread(
                 target=self._background_task,
                 daemon=True
@@ -122,8 +115,8 @@ class ExamplePlugin(PluginInterface):
         self.logger.info(f"Stopping {self.name}")
         
         try:
-            # Stop background thread
-            self.running_thread = False
+            # Stop background thread; setting the event wakes it immediately
+            self.stop_event.set()
             if self.background_thread and self.background_thread.is_alive():
                 self.background_thread.join(timeout=5)
             
@@ -177,16 +170,13 @@ class ExamplePlugin(PluginInterface):
     def _background_task(self) -> None:
         """Background task that runs periodically."""
         self.logger.info("Background task started")
+        wait = self.interval
         
-        while self.running_thread:
+        while not self.stop_event.is_set():
             try:
-                # Sleep for the configured interval
-                for _ in range(self.interval):
-                    if not self.running_thread:
-                        break
-                    time.sleep(1)
-                
-                if not self.running_thread:
+                # Wait for the configured interval (or the error backoff),
+                # or until stopped
+                if self.stop_event.wait(wait):
                     break
                 
                 # Perform some periodic task
@@ -203,10 +193,13 @@ class ExamplePlugin(PluginInterface):
                     }
                 ))
                 
-                self.logger.debug(f"Background task executed ({self.counter})")
+                self.logger.debug("Background task executed (%d)", self.counter)
+                wait = self.interval
             except Exception as e:
                 self.logger.exception(f"Error in background task: {str(e)}")
-                time.sleep(10)  # Sleep on error to avoid tight loop
+                # Double the wait on each consecutive error, but never retry
+                # sooner than the regular interval
+                wait = max(self.interval, min(wait * 2, self.max_error_backoff))
         
         self.logger.info("Background task stopped")
     
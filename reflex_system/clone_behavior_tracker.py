@@ -4,7 +4,6 @@ Clone Behavior Tracker for SARYA.
 Monitors clone actions and detects suspicious behavior patterns.
 """
 import datetime
-import logging
 import time
 from collections import defaultdict
 from typing import Dict, List, Optional
@@ -12,12 +11,6 @@ from typing import Dict, List, Optional
 from core.base_module import BaseModule
 from reflex_system.reflex_signal_router import reflex_signal_router
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
 class CloneBehaviorTracker(BaseModule):
     """
     Tracks and analyzes clone behavior patterns.
@@ -69,7 +62,7 @@ class CloneBehaviorTracker(BaseModule):
         }
         
         self.clone_log[clone_id].append(action)
-        self.logger.info(f"Logged {action_type} action for clone {clone_id}")
+        self.logger.info("Logged %s action for clone %s", action_type, clone_id)
         
         # Analyze after each high-risk action
         if action['risk_level'] == 'high':
@@ -134,9 +127,9 @@ class CloneBehaviorTracker(BaseModule):
             )
             
             self.logger.warning(
-                f"Suspicious behavior detected for clone {clone_id}: "
-                f"APM={actions_per_minute:.1f}, "
-                f"high_risk={high_risk_count}"
+                "Suspicious behavior detected for clone %s: "
+                "APM=%.1f, high_risk=%d",
+                clone_id, actions_per_minute, high_risk_count
             )
         
         return {
@@ -180,16 +173,16 @@ class CloneBehaviorTracker(BaseModule):
             
         actions = self.clone_log[clone_id]
         
-        # Count action types
+        # Count action types and high-risk actions in one pass
         action_counts = defaultdict(int)
+        high_risk_actions = 0
         for action in actions:
             action_counts[action['type']] += 1
+            if action['risk_level'] == 'high':
+                high_risk_actions += 1
         
         # Calculate risk score
-        high_risk_ratio = sum(
-            1 for a in actions 
-            if a['risk_level'] == 'high'
-        ) / len(actions)
+        high_risk_ratio = high_risk_actions / len(actions)
         
         risk_score = min(high_risk_ratio * 100, 100)
         
@@ -205,7 +198,7 @@ class CloneBehaviorTracker(BaseModule):
             'risk_score': risk_score,
             'last_reflex': last_reflex,
             'total_actions': len(actions),
-            'high_risk_actions': sum(1 for a in actions if a['risk_level'] == 'high'),
+            'high_risk_actions': high_risk_actions,
             'first_action_time': datetime.datetime.fromtimestamp(actions[0]['timestamp']),
             'last_action_time': datetime.datetime.fromtimestamp(actions[-1]['timestamp'])
         }
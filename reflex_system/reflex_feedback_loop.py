@@ -3,7 +3,6 @@
 Reflex Feedback Loop Engine for SARYA.
 Analyzes reflex patterns and provides reinforcement or suppression commands.
 """
-import logging
 import time
 from collections import defaultdict
 from typing import Dict, List, Optional, Tuple
@@ -12,12 +11,6 @@ from core.base_module import BaseModule
 from reflex_system.reflex_signal_router import reflex_signal_router
 from reflex_system.reflex_storage_sync import ReflexStorageSync
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
 class ReflexFeedbackLoop(BaseModule):
     """
     Processes reflex signals to identify patterns and manage feedback responses.
@@ -29,6 +22,14 @@ class ReflexFeedbackLoop(BaseModule):
     - Automated feedback response
     """
     
+    # Pattern type -> (response reflex type, response intensity)
+    RESPONSE_MAP = {
+        'loop': ('cooldown', 0.8),
+        'high_frequency': ('alert', 0.6),
+        'intensity_spike': ('suppress', 0.7),
+        'alternating_pattern': ('stabilize', 0.5)
+    }
+    
     def __init__(self):
         super().__init__("ReflexFeedbackLoop")
         self.storage_sync = ReflexStorageSync()
@@ -156,17 +157,11 @@ class ReflexFeedbackLoop(BaseModule):
         Returns:
             bool: True if response was triggered
         """
-        response_map = {
-            'loop': ('cooldown', 0.8),
-            'high_frequency': ('alert', 0.6),
-            'intensity_spike': ('suppress', 0.7),
-            'alternating_pattern': ('stabilize', 0.5)
-        }
-        
-        if pattern_type not in response_map:
+        response = self.RESPONSE_MAP.get(pattern_type)
+        if response is None:
             return False
             
-        reflex_type, intensity = response_map[pattern_type]
+        reflex_type, intensity = response
         
         signal_data = {
             'clone_id': clone_id,
@@ -197,11 +192,11 @@ class ReflexFeedbackLoop(BaseModule):
                 
                 if success:
                     self.logger.info(
-                        f"Triggered {pattern_type} response for clone {clone_id}"
+                        "Triggered %s response for clone %s", pattern_type, clone_id
                     )
                 else:
                     self.logger.warning(
-                        f"Failed to trigger response for pattern {pattern_type}"
+                        "Failed to trigger response for pattern %s", pattern_type
                     )
                     
         except Exception as e:
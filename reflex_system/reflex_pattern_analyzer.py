@@ -168,15 +168,15 @@ class ReflexPatternAnalyzer(BaseModule):
             return {"direction": "stable", "strength": 0}
             
         # Simple trend analysis based on frequency change
-        old_freq = len([
-            p for p in patterns
-            if time.time() - p["timestamp"] <= 120
-            and time.time() - p["timestamp"] > 60
-        ])
-        new_freq = len([
-            p for p in patterns
-            if time.time() - p["timestamp"] <= 60
-        ])
+        now = time.time()
+        old_freq = 0
+        new_freq = 0
+        for p in patterns:
+            age = now - p["timestamp"]
+            if age <= 60:
+                new_freq += 1
+            elif age <= 120:
+                old_freq += 1
         
         if new_freq > old_freq * 1.2:
             direction = "increasing"
@@ -3,7 +3,7 @@ Reflex Processor for SARYA.
 Coordinates between emotional and spiritual reflexes.
 """
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from core.base_module import BaseModule
 from core.event_bus import Event, event_bus
@@ -11,11 +11,14 @@ from reflex_system.emotional_reflex import emotional_reflex_manager
 from reflex_system.spiritual_reflex import spiritual_reflex_manager
 
 class ReflexProcessor(BaseModule):
+    MAX_BATCH_SIZE = 1000
+
     def __init__(self):
         super().__init__("ReflexProcessor")
 
     def _initialize(self) -> bool:
         event_bus.subscribe("reflex.process", self._on_process_request)
+        event_bus.subscribe("reflex.process.batch", self._on_process_batch_request)
         return True
 
     def process_reflex(self, data: Dict) -> Dict:
@@ -31,6 +34,23 @@ class ReflexProcessor(BaseModule):
             )
         }
 
+    def process_reflexes(self, batch: List[Dict]) -> List[Dict]:
+        # One result per event, in order; a failing event gets an error
+        # entry instead of aborting the rest of the batch
+        if len(batch) > self.MAX_BATCH_SIZE:
+            raise ValueError(
+                f"Batch of {len(batch)} exceeds limit of {self.MAX_BATCH_SIZE}"
+            )
+
+        results = []
+        for data in batch:
+            try:
+                results.append(self.process_reflex(data))
+            except Exception as e:
+                self.logger.error("Error processing reflex in batch: %s", e)
+                results.append({"error": str(e)})
+        return results
+
     def _integrate_responses(self, emotional: Dict, spiritual: Dict) -> Dict:
         return {
             "primary_response": emotional.get("emotional_response"),
@@ -51,4 +71,16 @@ class ReflexProcessor(BaseModule):
             data=result
         ))
 
+    def _on_process_batch_request(self, event: Event) -> None:
+        try:
+            data = {"results": self.process_reflexes(event.data.get("events", []))}
+        except ValueError as e:
+            self.logger.error("Rejected reflex batch: %s", e)
+            data = {"results": [], "error": str(e)}
+        event_bus.publish(Event(
+            "reflex.processed.batch",
+            source=self.name,
+            data=data
+        ))
+
 reflex_processor = ReflexProcessor()
\ No newline at end of file
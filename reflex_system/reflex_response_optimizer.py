@@ -2,12 +2,26 @@
 Reflex Response Optimizer for SARYA.
 Optimizes and tunes response thresholds based on historical performance.
 """
+import atexit
 import logging
+import threading
 import time
+import weakref
 from typing import Dict, Any, Optional
 from core.base_module import BaseModule
 from core.event_bus import event_bus
 
+# Live optimizers; unsaved thresholds are written at interpreter exit, since
+# the save timer is a daemon thread and _stop isn't guaranteed to run
+_instances: "weakref.WeakSet[ReflexResponseOptimizer]" = weakref.WeakSet()
+
+@atexit.register
+def _save_all() -> None:
+    """Save unsaved thresholds of every live optimizer."""
+    for optimizer in list(_instances):
+        if optimizer.thresholds_dirty:
+            optimizer.save_thresholds()
+
 class ReflexResponseOptimizer(BaseModule):
     """Optimizes reflex responses based on historical data."""
 
@@ -15,6 +29,14 @@ class ReflexResponseOptimizer(BaseModule):
         super().__init__("ReflexResponseOptimizer")
         self.response_thresholds = {}
         self.performance_history = {}
+        
+        # Threshold writes are batched; see update_thresholds
+        self.save_interval = 5.0  # seconds
+        self.last_save = 0.0
+        self.thresholds_dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.RLock()
+        _instances.add(self)
 
     def _initialize(self) -> bool:
         """Initialize optimizer."""
@@ -25,6 +47,12 @@ class ReflexResponseOptimizer(BaseModule):
             self.logger.error(f"Failed to initialize optimizer: {e}")
             return False
 
+    def _stop(self) -> bool:
+        """Stop optimizer, persisting any unsaved thresholds."""
+        if self.thresholds_dirty:
+            self.save_thresholds()
+        return True
+
     def optimize_response(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
         """
         Optimize response based on pattern analysis.
@@ -73,33 +101,46 @@ class ReflexResponseOptimizer(BaseModule):
             response_type: Type of response
             performance: Performance score (0-1)
         """
-        if response_type not in self.response_thresholds:
-            self.response_thresholds[response_type] = {
-                "min_intensity": 0.2,
-                "max_intensity": 0.8,
-                "scale_factor": 1.0
-            }
-
-        # Update history
-        if response_type not in self.performance_history:
-            self.performance_history[response_type] = []
-        self.performance_history[response_type].append(performance)
-
-        # Adjust thresholds based on performance
-        avg_performance = sum(self.performance_history[response_type][-5:]) / 5
-        thresholds = self.response_thresholds[response_type]
-
-        if avg_performance < 0.4:
-            # Poor performance - increase sensitivity
-            thresholds["scale_factor"] *= 1.1
-            thresholds["min_intensity"] *= 0.9
-        elif avg_performance > 0.8:
-            # Good performance - decrease sensitivity
-            thresholds["scale_factor"] *= 0.9
-            thresholds["max_intensity"] *= 1.1
-
-        # Save updated thresholds
-        self.save_thresholds()
+        # Mutate thresholds under the same lock the save timer holds while
+        # serializing them
+        with self._save_lock:
+            if response_type not in self.response_thresholds:
+                self.response_thresholds[response_type] = {
+                    "min_intensity": 0.2,
+                    "max_intensity": 0.8,
+                    "scale_factor": 1.0
+                }
+
+            # Update history
+            if response_type not in self.performance_history:
+                self.performance_history[response_type] = []
+            self.performance_history[response_type].append(performance)
+
+            # Adjust thresholds based on performance
+            avg_performance = sum(self.performance_history[response_type][-5:]) / 5
+            thresholds = self.response_thresholds[response_type]
+
+            if avg_performance < 0.4:
+                # Poor performance - increase sensitivity
+                thresholds["scale_factor"] *= 1.1
+                thresholds["min_intensity"] *= 0.9
+            elif avg_performance > 0.8:
+                # Good performance - decrease sensitivity
+                thresholds["scale_factor"] *= 0.9
+                thresholds["max_intensity"] *= 1.1
+
+            # Save updated thresholds at most once per save interval; a timer
+            # saves the last updates of a burst
+            self.thresholds_dirty = True
+            elapsed = time.time() - self.last_save
+            if elapsed >= self.save_interval:
+                self.save_thresholds()
+            elif self._save_timer is None:
+                self._save_timer = threading.Timer(
+                    self.save_interval - elapsed, self.save_thresholds
+                )
+                self._save_timer.daemon = True
+                self._save_timer.start()
 
     def get_optimized_response(self,
                              clone_id: str,
@@ -131,7 +172,13 @@ class ReflexResponseOptimizer(BaseModule):
 
     def save_thresholds(self) -> None:
         """Save thresholds to storage."""
-        self.memory.set("response_thresholds", self.response_thresholds)
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self.memory.set("response_thresholds", self.response_thresholds)
+            self.thresholds_dirty = False
+            self.last_save = time.time()
 
 # Initialize global instance
 response_optimizer = ReflexResponseOptimizer()
\ No newline at end of file
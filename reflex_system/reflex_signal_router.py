@@ -3,19 +3,14 @@
 Reflex Signal Router for SARYA.
 Routes and manages reflex signals between clones and handlers.
 """
-import logging
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from core.base_module import BaseModule
 from core.event_bus import Event, event_bus
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
 class ReflexSignalRouter(BaseModule):
     """
     Routes reflex signals to appropriate handlers and maintains logs.
@@ -27,10 +22,21 @@ class ReflexSignalRouter(BaseModule):
     - Filtered log retrieval
     """
     
-    def __init__(self):
+    def __init__(self, max_log_entries: int = 10000):
         super().__init__("ReflexSignalRouter")
         self.handlers: Dict[str, Callable] = {}
-        self.log: List[Dict[str, Any]] = []
+        self.max_log_entries = max_log_entries
+        
+        # Bounded to max_log_entries; appending to a full deque drops the
+        # oldest entry in O(1)
+        self.log: Deque[Dict[str, Any]] = deque(maxlen=max_log_entries)
+        
+        # Filter columns kept parallel to self.log, so get_log can scan
+        # flat sequences of strings instead of dereferencing every entry.
+        # All three deques are only touched under _log_lock.
+        self._log_types: Deque[str] = deque(maxlen=max_log_entries)
+        self._log_clone_ids: Deque[Optional[str]] = deque(maxlen=max_log_entries)
+        self._log_lock = threading.Lock()
         
     def _initialize(self) -> bool:
         """Initialize router and register default handlers."""
@@ -89,7 +95,10 @@ class ReflexSignalRouter(BaseModule):
             "intensity": signal_data.get("intensity", 0.0),
             "data": signal_data
         }
-        self.log.append(log_entry)
+        with self._log_lock:
+            self.log.append(log_entry)
+            self._log_types.append(reflex_type)
+            self._log_clone_ids.append(clone_id)
         
         # Route to handler
         handler = self.handlers.get(reflex_type, self.default_handler)
@@ -97,7 +106,7 @@ class ReflexSignalRouter(BaseModule):
             handler(signal_data)
             return True
         except Exception as e:
-            self.logger.error(f"Error handling reflex signal: {str(e)}")
+            self.logger.error("Error handling reflex signal: %s", e)
             return False
     
     def get_log(
@@ -117,15 +126,25 @@ class ReflexSignalRouter(BaseModule):
         Returns:
             List of filtered log entries
         """
-        filtered = self.log
+        with self._log_lock:
+            # Walk the columns newest-first and stop once the limit is reached
+            matches = []
+            for entry_type, entry_clone_id, entry in zip(
+                reversed(self._log_types),
+                reversed(self._log_clone_ids),
+                reversed(self.log)
+            ):
+                if filter_by_type and entry_type != filter_by_type:
+                    continue
+                if clone_id and entry_clone_id != clone_id:
+                    continue
+                matches.append(entry)
+                if len(matches) == limit:
+                    break
         
-        if filter_by_type:
-            filtered = [log for log in filtered if log["type"] == filter_by_type]
-            
-        if clone_id:
-            filtered = [log for log in filtered if log["clone_id"] == clone_id]
-            
-        return filtered[-limit:]
+        matches.reverse()
+        # No-op for positive limits; keeps slice semantics for limit <= 0
+        return matches[-limit:]
     
     def default_handler(self, signal_data: Dict[str, Any]) -> None:
         """
@@ -137,28 +156,31 @@ class ReflexSignalRouter(BaseModule):
         intensity = signal_data.get("intensity", 0.0)
         
         if intensity > 0.8:
-            self.logger.warning(f"High intensity reflex signal: {signal_data}")
+            self.logger.warning("High intensity reflex signal: %s", signal_data)
         else:
-            self.logger.info(f"Unhandled reflex signal: {signal_data}")
+            self.logger.info("Unhandled reflex signal: %s", signal_data)
     
     def handle_alert(self, signal_data: Dict[str, Any]) -> None:
         """Handle alert reflexes."""
         self.logger.warning(
-            f"Alert reflex triggered with intensity {signal_data.get('intensity', 0.0)}: "
-            f"{signal_data.get('message', 'No message')}"
+            "Alert reflex triggered with intensity %s: %s",
+            signal_data.get('intensity', 0.0),
+            signal_data.get('message', 'No message')
         )
     
     def handle_shutdown(self, signal_data: Dict[str, Any]) -> None:
         """Handle shutdown reflexes."""
         self.logger.info(
-            f"Shutdown reflex triggered with intensity {signal_data.get('intensity', 0.0)}"
+            "Shutdown reflex triggered with intensity %s",
+            signal_data.get('intensity', 0.0)
         )
         # In real implementation, trigger gradual shutdown
     
     def handle_cooldown(self, signal_data: Dict[str, Any]) -> None:
         """Handle cooldown reflexes."""
         self.logger.info(
-            f"Cooldown reflex triggered with intensity {signal_data.get('intensity', 0.0)}"
+            "Cooldown reflex triggered with intensity %s",
+            signal_data.get('intensity', 0.0)
         )
         # In real implementation, reduce system load
     
@@ -3,17 +3,25 @@
 Reflex Storage Sync for SARYA.
 Stores and analyzes reflex signals for behavioral patterns.
 """
+import atexit
 import datetime
 import json
 import logging
 import os
+import threading
+import time
+import weakref
 from typing import Dict, List, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Live instances, flushed together at interpreter exit. Held weakly so
+# registering for exit doesn't keep instances alive.
+_instances: "weakref.WeakSet[ReflexStorageSync]" = weakref.WeakSet()
+
+@atexit.register
+def _flush_all() -> None:
+    """Write out buffered signals of every live instance."""
+    for sync in list(_instances):
+        sync.flush()
 
 class ReflexStorageSync:
     """
@@ -21,22 +29,43 @@ class ReflexStorageSync:
     
     Features:
     - Signal storage with timestamps
+    - Batched writes to the log file
     - Behavioral analysis
     - Automated feedback
     - Clone-specific analysis
     """
     
-    def __init__(self, log_file_path: str = "data/reflex_log.json"):
+    def __init__(
+        self,
+        log_file_path: str = "data/reflex_log.json",
+        flush_every: int = 50,
+        flush_interval: float = 5.0
+    ):
         self.log_file_path = log_file_path
         self.reflex_cache: List[Dict] = []
         self.logger = logging.getLogger("ReflexStorageSync")
         
+        # Write batching: buffered signals are written once flush_every
+        # accumulate, or by a timer flush_interval seconds after the first
+        # unwritten one. Anything still buffered is flushed at exit.
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.pending_writes = 0
+        self.last_flush = time.time()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        
+        # (mtime_ns, size) of the log file when the cache last matched it
+        self._file_stat: Optional[tuple] = None
+        
         # Ensure data directory exists
         os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
         
         # Load existing logs
         self.load_log()
         
+        _instances.add(self)
+        
     def store_signal(self, reflex_data: Dict) -> bool:
         """
         Store a reflex signal with timestamp.
@@ -58,18 +87,25 @@ class ReflexStorageSync:
             required_fields = ["type", "trigger", "response", "intensity"]
             for field in required_fields:
                 if field not in signal:
-                    self.logger.error(f"Missing required field: {field}")
+                    self.logger.error("Missing required field: %s", field)
                     return False
             
-            # Add to cache
-            self.reflex_cache.append(signal)
-            
-            # Save to file
-            with open(self.log_file_path, 'w') as f:
-                json.dump({"signals": self.reflex_cache}, f, indent=2)
+            with self._lock:
+                # Add to cache
+                self.reflex_cache.append(signal)
+                self.pending_writes += 1
+                
+                # Check for critical signals
+                action = self.auto_feedback(signal)
                 
-            # Check for critical signals
-            self.auto_feedback(signal)
+                # Critical signals are written straight away; the rest once
+                # the batch fills up or the flush timer fires
+                if action or self.pending_writes >= self.flush_every:
+                    self.flush()
+                elif self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
             
             return True
             
@@ -77,6 +113,32 @@ class ReflexStorageSync:
             self.logger.error(f"Error storing signal: {str(e)}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Write all cached signals to the log file.
+        
+        Returns:
+            bool: True if the file is up to date
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            if not self.pending_writes:
+                return True
+                
+            try:
+                with open(self.log_file_path, 'w') as f:
+                    json.dump({"signals": self.reflex_cache}, f, indent=2)
+                self._file_stat = self._stat_log_file()
+                self.pending_writes = 0
+                self.last_flush = time.time()
+                return True
+            except Exception as e:
+                self.logger.error(f"Error flushing signals: {str(e)}")
+                return False
+    
     def load_log(self) -> List[Dict]:
         """
         Load reflex logs from file.
@@ -85,16 +147,34 @@ class ReflexStorageSync:
             List of stored reflex signals
         """
         try:
-            if os.path.exists(self.log_file_path):
-                with open(self.log_file_path, 'r') as f:
-                    data = json.load(f)
-                    self.reflex_cache = data.get("signals", [])
-                self.logger.info(f"Loaded {len(self.reflex_cache)} signals")
-            return self.reflex_cache
+            with self._lock:
+                # Persist buffered signals first; if that fails, keep the
+                # cache rather than reload over the unwritten signals
+                if not self.flush():
+                    return self.reflex_cache
+                
+                # Skip the parse when the file hasn't changed since it was
+                # last read or written
+                file_stat = self._stat_log_file()
+                if file_stat is not None and file_stat != self._file_stat:
+                    with open(self.log_file_path, 'r') as f:
+                        data = json.load(f)
+                        self.reflex_cache = data.get("signals", [])
+                    self._file_stat = file_stat
+                    self.logger.info("Loaded %d signals", len(self.reflex_cache))
+                return self.reflex_cache
         except Exception as e:
             self.logger.error(f"Error loading logs: {str(e)}")
             return []
     
+    def _stat_log_file(self) -> Optional[tuple]:
+        """Return (mtime_ns, size) of the log file, or None if missing."""
+        try:
+            st = os.stat(self.log_file_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
     def analyze_behavior(self, clone_id: Optional[str] = None) -> Dict:
         """
         Analyze reflex behavior patterns.
@@ -108,40 +188,37 @@ class ReflexStorageSync:
         now = datetime.datetime.utcnow().timestamp()
         five_mins_ago = now - (5 * 60)
         
-        # Filter signals
-        signals = self.reflex_cache
-        if clone_id:
-            signals = [s for s in signals if s.get("clone_id") == clone_id]
-        
-        # Recent high-intensity signals
-        high_intensity = [
-            s for s in signals 
-            if s["timestamp"] > five_mins_ago and s["intensity"] >= 0.8
-        ]
-        
-        # Count reflex types
+        # Filter, count types/triggers and find recent high-intensity
+        # signals in a single pass over the cache
+        total_signals = 0
+        high_intensity_count = 0
         reflex_counts = {}
-        for signal in signals:
+        triggers = {}
+        for signal in self.reflex_cache:
+            if clone_id and signal.get("clone_id") != clone_id:
+                continue
+            
+            total_signals += 1
+            if signal["timestamp"] > five_mins_ago and signal["intensity"] >= 0.8:
+                high_intensity_count += 1
+            
             reflex_type = signal["type"]
             reflex_counts[reflex_type] = reflex_counts.get(reflex_type, 0) + 1
-        
-        # Find most frequent trigger
-        triggers = {}
-        for signal in signals:
             trigger = signal["trigger"]
             triggers[trigger] = triggers.get(trigger, 0) + 1
         
+        # Find most frequent trigger
         most_frequent = max(triggers.items(), key=lambda x: x[1]) if triggers else ("none", 0)
         
         return {
-            "high_intensity_count": len(high_intensity),
-            "total_signals": len(signals),
+            "high_intensity_count": high_intensity_count,
+            "total_signals": total_signals,
             "reflex_distribution": reflex_counts,
             "most_frequent_trigger": {
                 "trigger": most_frequent[0],
                 "count": most_frequent[1]
             },
-            "potential_instability": len(high_intensity) > 3,
+            "potential_instability": high_intensity_count > 3,
             "analysis_timestamp": now
         }
     
@@ -160,7 +237,7 @@ class ReflexStorageSync:
         
         if intensity >= 0.9:
             action = "emergency_shutdown"
-            self.logger.warning(f"Critical intensity detected: {intensity}")
+            self.logger.warning("Critical intensity detected: %s", intensity)
             return action
             
         if clone_id:
@@ -173,7 +250,7 @@ class ReflexStorageSync:
             
             if len(recent) >= 3:
                 action = "isolate_clone"
-                self.logger.warning(f"Repetitive behavior detected from clone {clone_id}")
+                self.logger.warning("Repetitive behavior detected from clone %s", clone_id)
                 return action
         
         return None
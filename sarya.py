@@ -5,12 +5,15 @@ Main entry point for the SARYA system.
 """
 import argparse
 import asyncio
+import atexit
 import logging
 import os
+import queue
 import signal
 import sys
 import threading
 import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import List, Optional
 
 from api.main import start_api
@@ -28,14 +31,22 @@ from reflex_system.reflex_processor import reflex_processor
 from reflex_system.spiritual_reflex import spiritual_reflex_manager
 
 # Configure logging
+# Records are formatted and queued by the calling thread, then written to the
+# console and log file by a background listener so handler I/O stays off
+# hot paths.
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(
+    log_queue,
+    logging.StreamHandler(),
+    logging.FileHandler("sarya.log")
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("sarya.log")
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger("sarya")
 
 # Create intelligence module instance
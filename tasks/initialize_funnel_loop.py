@@ -1,18 +1,32 @@
 
 import asyncio
 import json
+import os
+import threading
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from supabase import create_client
 
 class FunnelOptimizer:
     def __init__(self):
-        self.supabase = create_client(
-            os.getenv("SUPABASE_URL"),
-            os.getenv("SUPABASE_KEY")
-        )
+        self._supabase = None
+        self._supabase_lock = threading.Lock()
         self.variations = self.load_variations()
         
+    @property
+    def supabase(self):
+        # Built on first use so importing this module never touches the network.
+        # The first use comes from several to_thread workers at once, so only
+        # one of them may create the client.
+        if self._supabase is None:
+            with self._supabase_lock:
+                if self._supabase is None:
+                    self._supabase = create_client(
+                        os.getenv("SUPABASE_URL"),
+                        os.getenv("SUPABASE_KEY")
+                    )
+        return self._supabase
+        
     def load_variations(self) -> List[Dict]:
         return [
             {
@@ -27,17 +41,37 @@ class FunnelOptimizer:
             }
         ]
         
+    def count_conversions(self, variation: Dict) -> Tuple[int, int]:
+        """Return (visits, conversions) for a variation, counted by Postgres."""
+        key = json.dumps(variation)
+        
+        # count="exact" returns the total in the Content-Range header, so at
+        # most one row crosses the wire regardless of traffic volume
+        visits = self.supabase.table("funnel_conversions")\
+            .select("converted", count="exact")\
+            .eq("variation", key)\
+            .limit(1)\
+            .execute()
+        conversions = self.supabase.table("funnel_conversions")\
+            .select("converted", count="exact")\
+            .eq("variation", key)\
+            .eq("converted", True)\
+            .limit(1)\
+            .execute()
+        
+        return visits.count or 0, conversions.count or 0
+        
     async def analyze_performance(self):
         while True:
-            for variation in self.variations:
-                stats = self.supabase.table("funnel_conversions")\
-                    .select("*")\
-                    .eq("variation", json.dumps(variation))\
-                    .execute()
-                    
+            # supabase-py is synchronous; keep its HTTP calls off the event loop
+            # and query all variations concurrently
+            counts = await asyncio.gather(*(
+                asyncio.to_thread(self.count_conversions, variation)
+                for variation in self.variations
+            ))
+            
+            for variation, (visits, conversions) in zip(self.variations, counts):
                 # Calculate conversion rate
-                visits = len(stats.data)
-                conversions = len([x for x in stats.data if x["converted"]])
                 ctr = conversions / visits if visits > 0 else 0
                 
                 print(f"Variation {variation['title']}: CTR = {ctr}")
@@ -0,0 +1,58 @@
+"""
+Tests for the example plugin background task.
+"""
+import unittest
+from unittest.mock import patch
+
+from plugins.example_plugin import ExamplePlugin
+
+class RecordingEvent:
+    """Stop event stand-in that records waits and stops after a few."""
+    
+    def __init__(self, max_waits):
+        self.waits = []
+        self.max_waits = max_waits
+        
+    def is_set(self):
+        return False
+        
+    def wait(self, timeout):
+        self.waits.append(timeout)
+        return len(self.waits) >= self.max_waits
+
+class TestExamplePluginBackoff(unittest.TestCase):
+    """Test cases for the background task error backoff."""
+    
+    def setUp(self):
+        """Set up a plugin whose heartbeat publish can be made to fail."""
+        self.plugin = ExamplePlugin()
+        self.plugin.interval = 60
+        self.plugin.max_error_backoff = 600
+        self.event_bus = patch("plugins.example_plugin.event_bus").start()
+        self.addCleanup(patch.stopall)
+        
+    def test_backoff_grows_from_interval(self):
+        """Test that repeated errors double the wait, capped, never below interval."""
+        self.event_bus.publish.side_effect = RuntimeError("publish failed")
+        self.plugin.stop_event = RecordingEvent(max_waits=7)
+        
+        with self.assertLogs("plugin.example_plugin", "ERROR"):
+            self.plugin._background_task()
+            
+        self.assertEqual(
+            self.plugin.stop_event.waits,
+            [60, 120, 240, 480, 600, 600, 600]
+        )
+        
+    def test_backoff_resets_after_success(self):
+        """Test that a successful run returns to the regular interval."""
+        self.event_bus.publish.side_effect = [RuntimeError("publish failed"), None, None]
+        self.plugin.stop_event = RecordingEvent(max_waits=4)
+        
+        with self.assertLogs("plugin.example_plugin", "ERROR"):
+            self.plugin._background_task()
+            
+        self.assertEqual(self.plugin.stop_event.waits, [60, 120, 60, 60])
+
+if __name__ == "__main__":
+    unittest.main()
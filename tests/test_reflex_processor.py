@@ -0,0 +1,67 @@
+"""
+Tests for batch processing in the SARYA reflex processor.
+"""
+import unittest
+from unittest.mock import patch
+
+from reflex_system.reflex_processor import ReflexProcessor
+
+class TestReflexProcessorBatch(unittest.TestCase):
+    """Test cases for ReflexProcessor.process_reflexes."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.processor = ReflexProcessor()
+        
+        def process_emotional_state(data):
+            if data.get("bad"):
+                raise KeyError("intensity")
+            return {"emotional_response": "calm", "intensity": data["intensity"]}
+        
+        emotional = patch(
+            "reflex_system.reflex_processor.emotional_reflex_manager"
+        ).start()
+        emotional.process_emotional_state.side_effect = process_emotional_state
+        spiritual = patch(
+            "reflex_system.reflex_processor.spiritual_reflex_manager"
+        ).start()
+        spiritual.interpret_pattern.return_value = {"guidance": "observe"}
+        self.addCleanup(patch.stopall)
+        
+    def test_batch_results_in_order(self):
+        """Test that each event gets its own result, in order."""
+        results = self.processor.process_reflexes([
+            {"intensity": 0.9},
+            {"intensity": 0.2}
+        ])
+        
+        self.assertEqual(len(results), 2)
+        self.assertEqual(
+            results[0]["integrated_response"]["recommended_action"],
+            "immediate_attention"
+        )
+        self.assertEqual(
+            results[1]["integrated_response"]["recommended_action"],
+            "normal_processing"
+        )
+        
+    def test_failed_event_isolated(self):
+        """Test that one bad event doesn't fail the whole batch."""
+        results = self.processor.process_reflexes([
+            {"intensity": 0.2},
+            {"bad": True},
+            {"intensity": 0.3}
+        ])
+        
+        self.assertEqual(len(results), 3)
+        self.assertIn("error", results[1])
+        self.assertIn("integrated_response", results[2])
+        
+    def test_batch_size_cap(self):
+        """Test that oversized batches are rejected."""
+        batch = [{"intensity": 0.1}] * (ReflexProcessor.MAX_BATCH_SIZE + 1)
+        with self.assertRaises(ValueError):
+            self.processor.process_reflexes(batch)
+
+if __name__ == "__main__":
+    unittest.main()
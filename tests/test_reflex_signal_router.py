@@ -0,0 +1,66 @@
+"""
+Tests for ReflexSignalRouter signal logging.
+"""
+import unittest
+
+from reflex_system.reflex_signal_router import ReflexSignalRouter
+
+class TestReflexSignalRouterLog(unittest.TestCase):
+    """Test cases for ReflexSignalRouter.get_log."""
+    
+    def setUp(self):
+        """Set up a router with a mixed signal log."""
+        self.router = ReflexSignalRouter()
+        self.router.register_handler("alert", lambda data: None)
+        self.router.register_handler("cooldown", lambda data: None)
+        
+        for i in range(30):
+            self.router.route_signal(
+                "alert" if i % 2 else "cooldown",
+                {"intensity": 0.1, "seq": i},
+                clone_id=f"clone_{i % 3}"
+            )
+            
+    def _reference_log(self, filter_by_type=None, clone_id=None, limit=100):
+        """Filter the full log the straightforward way."""
+        filtered = list(self.router.log)
+        if filter_by_type:
+            filtered = [log for log in filtered if log["type"] == filter_by_type]
+        if clone_id:
+            filtered = [log for log in filtered if log["clone_id"] == clone_id]
+        return filtered[-limit:]
+        
+    def test_filters_match_reference(self):
+        """Test filtered results against a full scan for a range of limits."""
+        for filter_by_type in (None, "alert", "missing"):
+            for clone_id in (None, "clone_1"):
+                for limit in (-3, 0, 1, 4, 100):
+                    self.assertEqual(
+                        self.router.get_log(filter_by_type, clone_id, limit),
+                        self._reference_log(filter_by_type, clone_id, limit),
+                        (filter_by_type, clone_id, limit)
+                    )
+                    
+    def test_newest_entries_in_order(self):
+        """Test that the limit keeps the newest entries, oldest first."""
+        logs = self.router.get_log(filter_by_type="alert", limit=2)
+        self.assertEqual([log["data"]["seq"] for log in logs], [27, 29])
+        
+    def test_log_trimmed_to_max(self):
+        """Test that the log never exceeds max_log_entries."""
+        router = ReflexSignalRouter(max_log_entries=10)
+        router.register_handler("alert", lambda data: None)
+        
+        for i in range(25):
+            router.route_signal("alert", {"seq": i}, clone_id=f"clone_{i % 2}")
+            self.assertLessEqual(len(router.log), 10)
+            
+        self.assertEqual([log["data"]["seq"] for log in router.log], list(range(15, 25)))
+        self.assertEqual(len(router._log_types), 10)
+        self.assertEqual(
+            [log["data"]["seq"] for log in router.get_log(clone_id="clone_1", limit=2)],
+            [21, 23]
+        )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+
+"""Tests for ReflexStorageSync."""
+import gc
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from reflex_system import reflex_storage_sync
+from reflex_system.reflex_storage_sync import ReflexStorageSync
+
+class TestReflexStorageSync(unittest.TestCase):
+    """Test cases for ReflexStorageSync."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.temp_dir.name, "reflex_log.json")
+        self.sync = ReflexStorageSync(self.log_path, flush_every=3)
+
+        self.test_signal = {
+            "type": "emotional",
+            "trigger": "system_overload",
+            "response": "stress",
+            "intensity": 0.5,
+            "clone_id": "clone_001"
+        }
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.sync.flush()
+        self.temp_dir.cleanup()
+
+    def _stored_signals(self):
+        with open(self.log_path) as f:
+            return json.load(f)["signals"]
+
+    def test_batched_writes(self):
+        """Test that signals are written once the batch fills up."""
+        for _ in range(2):
+            self.assertTrue(self.sync.store_signal(self.test_signal))
+        self.assertFalse(os.path.exists(self.log_path))
+
+        self.sync.store_signal(self.test_signal)
+        self.assertEqual(len(self._stored_signals()), 3)
+
+    def test_critical_signal_written_immediately(self):
+        """Test that signals triggering feedback skip the batch."""
+        self.sync.store_signal(dict(self.test_signal, intensity=0.95))
+        self.assertEqual(len(self._stored_signals()), 1)
+
+    def test_flush_interval_timer(self):
+        """Test that buffered signals are written without further writes."""
+        sync = ReflexStorageSync(self.log_path, flush_interval=0.05)
+        sync.store_signal(self.test_signal)
+        self.assertFalse(os.path.exists(self.log_path))
+
+        time.sleep(0.2)
+        self.assertEqual(sync.pending_writes, 0)
+        self.assertEqual(len(self._stored_signals()), 1)
+
+    def test_exit_flush(self):
+        """Test that buffered signals are written by the exit hook."""
+        self.sync.store_signal(self.test_signal)
+        reflex_storage_sync._flush_all()
+        self.assertEqual(len(self._stored_signals()), 1)
+
+    def test_exit_hook_holds_instances_weakly(self):
+        """Test that registering for exit doesn't keep instances alive."""
+        sync = ReflexStorageSync(self.log_path)
+        self.assertIn(sync, reflex_storage_sync._instances)
+        count = len(reflex_storage_sync._instances)
+
+        del sync
+        gc.collect()
+        self.assertEqual(len(reflex_storage_sync._instances), count - 1)
+
+    def test_failed_flush_keeps_cache(self):
+        """Test that a reload doesn't replace signals that failed to write."""
+        self.sync.store_signal(self.test_signal)
+        self.sync.flush()
+        self.sync.store_signal(self.test_signal)
+
+        # Change the file on disk, then make the next write fail
+        with open(self.log_path, "w") as f:
+            json.dump({"signals": []}, f)
+        self.sync.log_file_path = self.temp_dir.name
+        with self.assertLogs("ReflexStorageSync", "ERROR"):
+            self.assertEqual(len(self.sync.load_log()), 2)
+        self.assertEqual(self.sync.pending_writes, 1)
+        self.sync.log_file_path = self.log_path
+
+    def test_flush_and_reload(self):
+        """Test that buffered signals survive a reload."""
+        self.sync.store_signal(self.test_signal)
+        self.assertEqual(len(self.sync.load_log()), 1)
+
+        self.assertTrue(self.sync.flush())
+        self.assertEqual(len(self._stored_signals()), 1)
+
+    def test_reload_only_on_change(self):
+        """Test that load_log re-reads the file only after it changes."""
+        self.sync.store_signal(self.test_signal)
+        self.sync.flush()
+        cached = self.sync.load_log()
+        self.assertIs(self.sync.load_log(), cached)
+
+        with open(self.log_path, "w") as f:
+            json.dump({"signals": [self.test_signal] * 2}, f)
+        self.assertEqual(len(self.sync.load_log()), 2)
+
+    def test_missing_fields_rejected(self):
+        """Test that incomplete signals are not stored."""
+        self.assertFalse(self.sync.store_signal({"type": "emotional"}))
+        self.assertEqual(self.sync.pending_writes, 0)
+
+    def test_analyze_behavior(self):
+        """Test analysis counts, optionally filtered by clone."""
+        other = dict(self.test_signal, clone_id="clone_002",
+                     trigger="memory_leak", intensity=0.9)
+        for signal in (self.test_signal, self.test_signal, other):
+            self.sync.store_signal(signal)
+
+        analysis = self.sync.analyze_behavior()
+        self.assertEqual(analysis["total_signals"], 3)
+        self.assertEqual(analysis["high_intensity_count"], 1)
+        self.assertEqual(analysis["reflex_distribution"], {"emotional": 3})
+        self.assertEqual(
+            analysis["most_frequent_trigger"],
+            {"trigger": "system_overload", "count": 2}
+        )
+
+        analysis = self.sync.analyze_behavior(clone_id="clone_002")
+        self.assertEqual(analysis["total_signals"], 1)
+        self.assertEqual(analysis["most_frequent_trigger"]["trigger"], "memory_leak")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+
+"""Tests for the self-diagnosis scanner."""
+import os
+import tempfile
+import unittest
+
+from self_diagnosis import scan_directory
+
+class TestSelfDiagnosis(unittest.TestCase):
+    """Test cases for scan_directory."""
+
+    def setUp(self):
+        """Set up a small source tree."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = self.temp_dir.name
+        os.makedirs(os.path.join(root, "pkg"))
+
+        files = {
+            "todo.py": "# TODO: implement\n",
+            "stub.py": "def f():\n    pass\n",
+            "clean.py": "x = 1\n",
+            "empty.py": "",
+            "notes.txt": "TODO\n",
+            os.path.join("pkg", "nested.py"): "class A:\n    pass\n",
+        }
+        for name, content in files.items():
+            with open(os.path.join(root, name), "w") as f:
+                f.write(content)
+
+    def tearDown(self):
+        """Clean up the source tree."""
+        self.temp_dir.cleanup()
+
+    def test_detects_placeholders(self):
+        """Test that only Python files with placeholders are reported."""
+        results = scan_directory(self.temp_dir.name)
+        flagged = sorted(
+            os.path.relpath(r["file"], self.temp_dir.name) for r in results
+        )
+
+        self.assertEqual(
+            flagged,
+            sorted(["todo.py", "stub.py", os.path.join("pkg", "nested.py")])
+        )
+        for result in results:
+            self.assertEqual(result["severity"], "low")
+            self.assertIn("detected_at", result)
+
+    def test_missing_directory(self):
+        """Test that an unreadable directory is skipped, not raised."""
+        missing = os.path.join(self.temp_dir.name, "missing")
+        self.assertEqual(scan_directory(missing), [])
+
+    def test_single_worker(self):
+        """Test that results don't depend on the number of workers."""
+        serial = scan_directory(self.temp_dir.name, max_workers=1)
+        parallel = scan_directory(self.temp_dir.name)
+
+        self.assertEqual(
+            [r["file"] for r in serial],
+            [r["file"] for r in parallel]
+        )
+
+if __name__ == "__main__":
+    unittest.main()